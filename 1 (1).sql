@@ -54,6 +54,10 @@ CREATE TABLE Audit_Tenant (
     change_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Tenant(house_no) and the (apartment_id, house_no) prefix of Maintenance are already indexed by their primary keys
+CREATE INDEX ix_maint_apt_house_status ON Maintenance(apartment_id, house_no, status);
+CREATE INDEX ix_audit_change_date ON Audit_Tenant(change_date DESC);
+
 
 
 INSERT INTO Apartment VALUES (1, 'BSR Apartments', 'Chrompet', 3, 1200);
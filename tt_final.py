@@ -4,6 +4,15 @@ from tkinter import messagebox
 import cx_Oracle
 import os
 import datetime
+import collections
+import hashlib
+import hmac
+import contextlib
+import threading
+import time
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 #Strategy Design Pattern
 class PaymentStrategy(ABC):
@@ -22,24 +31,69 @@ class BankTransferPayment(PaymentStrategy):
     def process_payment(self, house_no, payment_date, amount_paid):
         print(f"Processing bank transfer payment of {amount_paid} for house {house_no} on {payment_date}.")
 
-# Singleton Pattern for database connection
+# Strategies are stateless, so one shared instance per payment method is enough
+PAYMENT_STRATEGIES = {
+    "Credit Card": CreditCardPayment(),
+    "Cash": CashPayment(),
+    "Bank Transfer": BankTransferPayment(),
+}
+
+# Fetched dates are only displayed, so hand them back as preformatted strings
+def fast_output_types(cursor, name, default_type, size, precision, scale):
+    if default_type == cx_Oracle.DATETIME:
+        return cursor.var(str, 32, arraysize=cursor.arraysize)
+
+# Runs once per new pooled session so fetched dates stringify in ISO format
+def init_session(connection, requested_tag):
+    cursor = connection.cursor()
+    cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD' "
+                   "NLS_TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS'")
+    cursor.close()
+
+# Singleton Pattern for database connection pool
 class DatabaseConnection:
     _instance = None
+    _pool = None
+    STATEMENT_CACHE_SIZE = 50
 
     def __new__(cls, user, password, dsn):
         if cls._instance is None:
             try:
                 cls._instance = super(DatabaseConnection, cls).__new__(cls)
-                cls._instance.connection = cx_Oracle.connect(user=user, password=password, dsn=dsn)
+                cls._pool = cx_Oracle.SessionPool(user=user, password=password, dsn=dsn,
+                                                  min=2, max=8, increment=1, threaded=True,
+                                                  getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT,
+                                                  sessionCallback=init_session)
+                # Each pooled session keeps its parsed statements, so repeat executes skip the parse
+                cls._pool.stmtcachesize = cls.STATEMENT_CACHE_SIZE
                 print("Connected to the database!")
             except cx_Oracle.DatabaseError as e:
                 print(f"Database connection error: {e}")
                 cls._instance = None
         return cls._instance
 
+    # Acquire a pooled connection for the duration of a with block
     @classmethod
+    @contextlib.contextmanager
     def get_connection(cls):
-        return cls._instance.connection if cls._instance else None
+        connection = cls._pool.acquire() if cls._pool else None
+        if connection is not None:
+            connection.outputtypehandler = fast_output_types
+        try:
+            yield connection
+        finally:
+            if connection is not None:
+                cls._pool.release(connection)
+
+    @classmethod
+    def close(cls):
+        if cls._pool:
+            cls._pool.close()
+            cls._pool = None
+        cls._instance = None
+
+# One tenant as passed to observers
+TenantRow = collections.namedtuple("TenantRow", "house_no tenant_name phone_number apartment_id move_in_date")
 
 # Command Pattern for database operations
 class Command:
@@ -47,66 +101,110 @@ class Command:
         raise NotImplementedError("Subclasses should implement this method")
 
 class ListApartmentsCommand(Command):
-    def __init__(self, connection):
-        self.connection = connection
+    # Apartments change rarely, so results are shared between instances for CACHE_TTL seconds
+    CACHE_TTL = 60
+    _cache = None
+    _cache_ts = 0
+    _cache_lock = threading.Lock()
 
-    def execute(self):
-        if not self.connection:
-            print("No database connection available.")
-            return None
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT apartment_id, apartment_name, address, num_of_rooms, rent
-                FROM Apartment
-            """)
-            apartments = cursor.fetchall()
-            if apartments:
-                return apartments  
-            else:
-                print("No apartments found.")
-                return []
-        except cx_Oracle.DatabaseError as e:
-            print(f"Error listing apartments: {e}")
+    def __init__(self, db):
+        self.db = db
+
+    @classmethod
+    def cached_batches(cls):
+        with cls._cache_lock:
+            if cls._cache is not None and time.monotonic() - cls._cache_ts < cls.CACHE_TTL:
+                return cls._cache
             return None
-        finally:
-            if cursor:
-                cursor.close()
 
+    @classmethod
+    def store_cache(cls, batches):
+        with cls._cache_lock:
+            cls._cache = batches
+            cls._cache_ts = time.monotonic()
 
-class AddTenantCommand(Command):
-    def __init__(self, connection, house_no, tenant_name, phone_number, apartment_id, move_in_date):
-        self.connection = connection
-        self.house_no = house_no
-        self.tenant_name = tenant_name
-        self.phone_number = phone_number
-        self.apartment_id = apartment_id
-        self.move_in_date = move_in_date
+    @classmethod
+    def invalidate_cache(cls):
+        with cls._cache_lock:
+            cls._cache = None
 
+    # Yields the apartments in batches of cursor.arraysize rows
     def execute(self):
-        if not self.connection:
-            print("No database connection available.")
+        cached = self.cached_batches()
+        if cached is not None:
+            yield from cached
             return
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO Tenant (house_no, tenant_name, phone_number, apartment_id, move_in_date)
-                VALUES (:1, :2, :3, :4, :5)
-            """, (self.house_no, self.tenant_name, self.phone_number, self.apartment_id, self.move_in_date))
-            self.connection.commit()
-            print(f"Tenant '{self.tenant_name}' added successfully.")
-        except cx_Oracle.DatabaseError as e:
-            self.connection.rollback()
-            print(f"Error adding tenant: {e}")
-        finally:
-            if cursor:
-                cursor.close()
+        with self.db.get_connection() as connection:
+            if not connection:
+                print("No database connection available.")
+                return
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                cursor.arraysize = 1000
+                cursor.prefetchrows = 1001
+                cursor.execute("""
+                    SELECT apartment_id, apartment_name, address, num_of_rooms, rent
+                    FROM Apartment
+                """)
+                batches = []
+                for apartments in iter(cursor.fetchmany, []):
+                    batches.append(apartments)
+                    yield apartments
+                if not batches:
+                    print("No apartments found.")
+                self.store_cache(batches)
+            except cx_Oracle.DatabaseError as e:
+                print(f"Error listing apartments: {e}")
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+
+
+class AddTenantCommand(Command):
+    # rows is a list of (house_no, tenant_name, phone_number, apartment_id, move_in_date) tuples
+    def __init__(self, db, rows):
+        self.db = db
+        self.rows = list(rows)
+        self.errors = []
+
+    @classmethod
+    def from_single(cls, db, house_no, tenant_name, phone_number, apartment_id, move_in_date):
+        return cls(db, [(house_no, tenant_name, phone_number, apartment_id, move_in_date)])
+
+    def execute(self):
+        with self.db.get_connection() as connection:
+            if not connection:
+                print("No database connection available.")
+                return
+            if not self.rows:
+                return
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                cursor.bindarraysize = len(self.rows)
+                # Sizes follow the Tenant columns: house_no, tenant_name, phone_number, apartment_id, move_in_date
+                cursor.setinputsizes(10, 50, 15, int, cx_Oracle.DATETIME)
+                cursor.executemany("""
+                    INSERT INTO Tenant (house_no, tenant_name, phone_number, apartment_id, move_in_date)
+                    VALUES (:1, :2, :3, :4, :5)
+                """, self.rows, batcherrors=True)
+                self.errors = cursor.getbatcherrors()
+                for error in self.errors:
+                    print(f"Error adding tenant '{self.rows[error.offset][1]}': {error.message}")
+                connection.commit()
+                print(f"{len(self.rows) - len(self.errors)} tenant(s) added successfully.")
+            except cx_Oracle.DatabaseError as e:
+                connection.rollback()
+                print(f"Error adding tenant: {e}")
+            finally:
+                if cursor:
+                    cursor.close()
 
 class UpdateTenantCommand(Command):
-    def __init__(self, connection, house_no, tenant_name, phone_number, apartment_id, move_in_date):
-        self.connection = connection
+    def __init__(self, db, house_no, tenant_name, phone_number, apartment_id, move_in_date):
+        self.db = db
         self.house_no = house_no
         self.tenant_name = tenant_name
         self.phone_number = phone_number
@@ -114,80 +212,110 @@ class UpdateTenantCommand(Command):
         self.move_in_date = move_in_date
 
     def execute(self):
-        if not self.connection:
-            print("No database connection available.")
-            return
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                UPDATE Tenant
-                SET tenant_name = :1, phone_number = :2, apartment_id = :3, move_in_date = :4
-                WHERE house_no = :5
-            """, (self.tenant_name, self.phone_number, self.apartment_id, self.move_in_date, self.house_no))
-            self.connection.commit()
-            print(f"Tenant '{self.tenant_name}' updated successfully.")
-        except cx_Oracle.DatabaseError as e:
-            self.connection.rollback()
-            print(f"Error updating tenant: {e}")
-        finally:
-            if cursor:
-                cursor.close()
+        with self.db.get_connection() as connection:
+            if not connection:
+                print("No database connection available.")
+                return
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                cursor.setinputsizes(50, 15, int, cx_Oracle.DATETIME, 10)
+                cursor.execute("""
+                    UPDATE Tenant
+                    SET tenant_name = :1, phone_number = :2, apartment_id = :3, move_in_date = :4
+                    WHERE house_no = :5
+                """, (self.tenant_name, self.phone_number, self.apartment_id, self.move_in_date, self.house_no))
+                connection.commit()
+                print(f"Tenant '{self.tenant_name}' updated successfully.")
+            except cx_Oracle.DatabaseError as e:
+                connection.rollback()
+                print(f"Error updating tenant: {e}")
+            finally:
+                if cursor:
+                    cursor.close()
 
 class DeleteTenantCommand(Command):
-    def __init__(self, connection, house_no):
-        self.connection = connection
+    def __init__(self, db, house_no):
+        self.db = db
         self.house_no = house_no
-        
+        # Filled from the deleted row, stays None when no tenant matched
+        self.tenant_data = None
 
     def execute(self):
-        if not self.connection:
-            print("No database connection available.")
-            return
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("DELETE FROM Tenant WHERE house_no = :1", (self.house_no,))
-            self.connection.commit()
-            print(f"Tenant Record in '{self.house_no}' deleted successfully.")
-        except cx_Oracle.DatabaseError as e:
-            self.connection.rollback()
-            print(f"Error deleting tenant: {e}")
-        finally:
-            if cursor:
-                cursor.close()
+        with self.db.get_connection() as connection:
+            if not connection:
+                print("No database connection available.")
+                return
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                tenant_name = cursor.var(str, 50)
+                phone_number = cursor.var(str, 15)
+                apartment_id = cursor.var(int)
+                move_in_date = cursor.var(cx_Oracle.DATETIME)
+                cursor.execute("""
+                    DELETE FROM Tenant WHERE house_no = :h
+                    RETURNING tenant_name, phone_number, apartment_id, move_in_date INTO :n, :p, :a, :d
+                """, h=self.house_no, n=tenant_name, p=phone_number, a=apartment_id, d=move_in_date)
+                if cursor.rowcount == 0:
+                    print(f"No tenant found in '{self.house_no}'.")
+                    return
+                connection.commit()
+                self.tenant_data = TenantRow(self.house_no, tenant_name.getvalue()[0], phone_number.getvalue()[0],
+                                             apartment_id.getvalue()[0], move_in_date.getvalue()[0])
+                print(f"Tenant Record in '{self.house_no}' deleted successfully.")
+            except cx_Oracle.DatabaseError as e:
+                connection.rollback()
+                print(f"Error deleting tenant: {e}")
+            finally:
+                if cursor:
+                    cursor.close()
 
 class ListTenantsCommand(Command):
-    def __init__(self, connection):
-        self.connection = connection
+    # With a limit only that page of tenants, in house_no order, is fetched
+    def __init__(self, db, offset=0, limit=None):
+        self.db = db
+        self.offset = offset
+        self.limit = limit
 
+    # Yields the tenants in batches of cursor.arraysize rows
     def execute(self):
-        if not self.connection:
-            print("No database connection available.")
-            return None 
+        with self.db.get_connection() as connection:
+            if not connection:
+                print("No database connection available.")
+                return
         
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT house_no, tenant_name, phone_number, apartment_id, move_in_date, due_amount
-                FROM Tenant
-            """)
-            tenants = cursor.fetchall()
-            if tenants:
-                print("List of Tenants:")
-                for tenant in tenants:
-                    print(f"House No: {tenant[0]}, Name: {tenant[1]}, Phone: {tenant[2]}, "
-                          f"Apartment ID: {tenant[3]}, Move-In Date: {tenant[4]}, Due Amount: {tenant[5]}")
-            else:
-                print("No tenants found.")
-            return tenants  
-        except cx_Oracle.DatabaseError as e:
-            print(f"Error listing tenants: {e}")
-            return None
-        finally:
-            if cursor:
-                cursor.close()
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                cursor.arraysize = 1000
+                cursor.prefetchrows = 1001
+                sql = """
+                    SELECT house_no, tenant_name, phone_number, apartment_id, move_in_date, due_amount
+                    FROM Tenant
+                """
+                if self.limit is None:
+                    cursor.execute(sql)
+                else:
+                    cursor.execute(sql + "ORDER BY house_no OFFSET :o ROWS FETCH NEXT :l ROWS ONLY",
+                                   o=self.offset, l=self.limit)
+                found = False
+                for tenants in iter(cursor.fetchmany, []):
+                    if not found:
+                        print("List of Tenants:")
+                        found = True
+                    for tenant in tenants:
+                        print(f"House No: {tenant[0]}, Name: {tenant[1]}, Phone: {tenant[2]}, "
+                              f"Apartment ID: {tenant[3]}, Move-In Date: {tenant[4]}, Due Amount: {tenant[5]}")
+                    yield tenants
+                if not found:
+                    print("No tenants found.")
+            except cx_Oracle.DatabaseError as e:
+                print(f"Error listing tenants: {e}")
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
 
 
 # Observer Pattern for audit logging
@@ -195,34 +323,87 @@ class Observer:
     def update(self, event_type, data):
         raise NotImplementedError("Subclasses should implement this method")
 
-class AuditLogger(Observer):
-    def __init__(self, connection):
-        self.connection = connection
+    # Observers that buffer events write them out here
+    def flush(self):
+        pass
 
+class AuditLogger(Observer):
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL = 2.0
+
+    def __init__(self, db):
+        self.db = db
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        # Held for a whole flush, so close() waits for a timer flush that is already writing
+        self._flush_lock = threading.Lock()
+        self._timer = None
+
+    # data is a TenantRow, or a dict keyed by the same field names
     def update(self, event_type, data):
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            if event_type == 'DELETE':
-                # Log only the house_no for DELETE event
-                cursor.execute("""
-                    INSERT INTO Audit_Tenant (house_no, action)
-                    VALUES (:1, :2)
-                """, (data['house_no'], event_type))
-            else:
-                # For other events, log full tenant details
-                cursor.execute("""
-                    INSERT INTO Audit_Tenant (house_no, tenant_name, phone_number, apartment_id, move_in_date, action)
-                    VALUES (:1, :2, :3, :4, :5, :6)
-                """, (data['house_no'], data['tenant_name'], data['phone_number'], data['apartment_id'], data['move_in_date'], event_type))
+        if isinstance(data, dict):
+            data = TenantRow(*(data.get(field) for field in TenantRow._fields))
+        # Stamped now, not at flush time, so buffered rows keep the time the change happened
+        change_date = datetime.datetime.now()
+        if event_type == 'DELETE':
+            # Log only the house_no for DELETE event
+            row = (data.house_no, None, None, None, None, event_type, change_date)
+        else:
+            # For other events, log full tenant details
+            row = (*data, event_type, change_date)
+        self._pending.append(row)
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            rows = []
+            while self._pending:
+                rows.append(self._pending.popleft())
+        if not rows:
+            return
+        with self.db.get_connection() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                # Direct-path only pays off for full batches: it writes above the high-water mark
+                # and locks the table, so small flushes use a conventional insert
+                hint = "/*+ APPEND_VALUES */" if len(rows) >= self.BATCH_SIZE else ""
+                cursor.bindarraysize = len(rows)
+                cursor.setinputsizes(10, 50, 15, int, cx_Oracle.DATETIME, 10, cx_Oracle.TIMESTAMP)
+                cursor.executemany(f"""
+                    INSERT {hint} INTO Audit_Tenant (house_no, tenant_name, phone_number, apartment_id, move_in_date, action, change_date)
+                    VALUES (:1, :2, :3, :4, :5, :6, :7)
+                """, rows, batcherrors=True)
+                errors = cursor.getbatcherrors()
+                for error in errors:
+                    print(f"Error logging audit for '{rows[error.offset][0]}': {error.message}")
+                connection.commit()
+                print(f"Audit log added for {len(rows) - len(errors)} action(s).")
+            except cx_Oracle.DatabaseError as e:
+                print(f"Error logging audit: {e}")
+            finally:
+                if cursor:
+                    cursor.close()
 
-            self.connection.commit()
-            print(f"Audit log added for {event_type} action.")
-        except cx_Oracle.DatabaseError as e:
-            print(f"Error logging audit: {e}")
-        finally:
-            if cursor:
-                cursor.close()
+    def close(self):
+        self.flush()
 
 
 # Subject class for notifying observers
@@ -238,45 +419,191 @@ class TenantManager:
         for observer in self.observers:
             observer.update(event_type, data)
 
+    def flush_observers(self):
+        for observer in self.observers:
+            observer.flush()
+
     def list_apartments(self, command):
         apartments = command.execute()  
         return apartments
 
     def add_tenant(self, command):
         command.execute()
-        tenant_data = {
-            'house_no': command.house_no,
-            'tenant_name': command.tenant_name,
-            'phone_number': command.phone_number,
-            'apartment_id': command.apartment_id,
-            'move_in_date': command.move_in_date
-        }
-        self.notify_observers('INSERT', tenant_data)
+        failed = {error.offset for error in command.errors}
+        for offset, row in enumerate(command.rows):
+            if offset in failed:
+                continue
+            self.notify_observers('INSERT', TenantRow(*row))
 
     def update_tenant(self, command):
         command.execute()
-        tenant_data = {
-            'house_no': command.house_no,
-            'tenant_name': command.tenant_name,
-            'phone_number': command.phone_number,
-            'apartment_id': command.apartment_id,
-            'move_in_date': command.move_in_date
-        }
+        tenant_data = TenantRow(command.house_no, command.tenant_name, command.phone_number,
+                                command.apartment_id, command.move_in_date)
         self.notify_observers('UPDATE', tenant_data)
 
     def delete_tenant(self,command):
         command.execute()
-        tenant_data = {
-            'house_no': command.house_no,
-        }
-        self.notify_observers('DELETE', tenant_data)
+        if command.tenant_data is not None:
+            self.notify_observers('DELETE', command.tenant_data)
+
+# Runs blocking database work on a thread pool and hands results back to the Tk main loop
+class BackgroundWorkerMixin:
+    POLL_INTERVAL = 50
+
+    # Workers never touch Tk; they queue callbacks that the main loop drains every POLL_INTERVAL ms
+    def start_executor(self, max_workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.db_queue = queue.Queue()
+        self._closed = False
+        self.after(self.POLL_INTERVAL, self._poll_queue)
+        # The window manager's close button would otherwise bypass destroy() below
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def post(self, callback, *args):
+        self.db_queue.put((callback, args))
+
+    def _poll_queue(self):
+        if self._closed:
+            return
+        try:
+            while True:
+                try:
+                    callback, args = self.db_queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback(*args)
+        finally:
+            self.after(self.POLL_INTERVAL, self._poll_queue)
+
+    def run_in_background(self, work, on_done, on_error=None):
+        future = self.executor.submit(work)
+
+        def deliver(f):
+            if self._closed:
+                return
+            error = f.exception()
+            if error is None:
+                self.post(on_done, f.result())
+            elif on_error is not None:
+                self.post(on_error, error)
+            else:
+                print(f"Background task failed: {error}")
+
+        future.add_done_callback(deliver)
+
+    # Pulls batches on the worker thread and inserts each one as soon as it arrives.
+    # Once is_current() turns false the generator is closed, which releases its cursor and connection
+    def stream_in_background(self, batches, on_batch, on_done=None, on_error=None, is_current=None):
+        def work():
+            count = 0
+            try:
+                for batch in batches:
+                    if self._closed or (is_current is not None and not is_current()):
+                        break
+                    count += len(batch)
+                    self.post(on_batch, batch)
+            finally:
+                batches.close()
+            return count
+
+        self.run_in_background(work, on_done or (lambda count: None), on_error)
+
+    # Queued work is dropped and running work is waited for, so no worker still holds a pooled
+    # connection or owes an audit row when main flushes the logger and closes the pool
+    def destroy(self):
+        self._closed = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        super().destroy()
+
+# Fills a Treeview one page at a time and fetches the next page once the view scrolls near the bottom
+class TreePager:
+    PAGE_SIZE = 200
+
+    # fetch_page(offset, limit) runs on a worker and returns a list of rows
+    def __init__(self, app, tree, scrollbar, fetch_page, on_error, empty_values=None):
+        self.app = app
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.fetch_page = fetch_page
+        self.on_error = on_error
+        self.empty_values = empty_values
+        self.generation = 0
+        self.loaded = 0
+        self.loading = False
+        self.exhausted = False
+        # Hidden trees still get scroll callbacks on layout, so nothing loads until a view calls reset()
+        self.started = False
+        tree.configure(yscrollcommand=self.on_scroll)
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.started and float(last) > 0.9:
+            self.load_more()
+
+    def load_more(self):
+        if self.loading or self.exhausted:
+            return
+        self.loading = True
+        generation, offset = self.generation, self.loaded
+        self.app.run_in_background(
+            lambda: self.fetch_page(offset, self.PAGE_SIZE),
+            lambda rows: self.page_fetched(generation, rows),
+            lambda e: self.page_failed(generation, e)
+        )
+
+    def page_fetched(self, generation, rows):
+        if generation != self.generation or not self.tree.winfo_exists():
+            return
+        self.loading = False
+        self.loaded += len(rows)
+        self.exhausted = len(rows) < self.PAGE_SIZE
+        # Columns are hidden while the page goes in so the tree is laid out once, not per row
+        self.tree.configure(displaycolumns=())
+        try:
+            if self.loaded == 0 and self.empty_values is not None:
+                self.tree.insert("", "end", values=self.empty_values)
+            for row in rows:
+                self.tree.insert("", "end", values=row)
+        finally:
+            self.tree.configure(displaycolumns="#all")
+        self.app.update_idletasks()
+        # A page that does not fill the view triggers no scroll, so keep going until it does
+        if self.started and not self.exhausted and self.tree.yview()[1] > 0.9:
+            self.load_more()
+
+    # Clears the tree and starts over from the first page; pages still in flight are dropped
+    def reset(self):
+        self.generation += 1
+        self.started = True
+        self.loaded = 0
+        self.loading = False
+        self.exhausted = False
+        self.tree.delete(*self.tree.get_children())
+
+    def page_failed(self, generation, error):
+        if generation != self.generation:
+            return
+        self.loading = False
+        self.exhausted = True
+        self.on_error(error)
+
+# Move-in dates keep the strptime('%Y-%m-%d') rules; the common zero-padded form takes the fromisoformat fast path
+ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+def parse_move_in_date(text):
+    if ISO_DATE_RE.fullmatch(text):
+        return datetime.date.fromisoformat(text)
+    return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+
+# Only the digest of the admin password is kept; it is compared in constant time
+ADMIN_PASSWORD_HASH = hashlib.blake2b(b"admin123").digest()
 
 # GUI code for login page
 class LoginPage(tk.Tk):
-    def __init__(self, tenant_manager, db_connection):
+    def __init__(self, tenant_manager, db):
         super().__init__()
         self.tenant_manager = tenant_manager
-        self.db_connection = db_connection
+        self.db = db
         self.title("Login Page")
         self.geometry("300x350")
 
@@ -292,13 +619,27 @@ class LoginPage(tk.Tk):
         tk.Button(self, text="Login as Admin", command=self.admin_login).pack(pady=10)
         tk.Button(self, text="Login as Tenant", command=self.tenant_login).pack(pady=10)
 
+        # The login window holds one pooled connection with the tenant check prepared on it
+        self._login_connection = contextlib.ExitStack()
+        connection = self._login_connection.enter_context(self.db.get_connection())
+        self._login_cur = connection.cursor()
+        self._login_cur.prepare("SELECT 1 FROM Tenant WHERE house_no = :h")
+
+    def destroy(self):
+        if self._login_cur is not None:
+            self._login_cur.close()
+            self._login_cur = None
+        self._login_connection.close()
+        super().destroy()
+
     def admin_login(self):
         username = self.username_entry.get()
         password = self.password_entry.get()
 
-        if username == "admin" and password == "admin123":
+        password_hash = hashlib.blake2b(password.encode()).digest()
+        if username == "admin" and hmac.compare_digest(password_hash, ADMIN_PASSWORD_HASH):
             self.destroy()  
-            admin_app = AdminApp(self.tenant_manager, self.db_connection) 
+            admin_app = AdminApp(self.tenant_manager, self.db) 
             admin_app.mainloop()
         else:
             messagebox.showerror("Login Failed", "Invalid admin credentials.")
@@ -307,31 +648,33 @@ class LoginPage(tk.Tk):
         house_no = self.username_entry.get()  
         password = self.password_entry.get()  
 
-        cursor = self.db_connection.cursor()
+        tenant_data = None
         try:
             if password == "tenant123":
-                cursor.execute("SELECT house_no FROM Tenant WHERE house_no = :house_no", {'house_no': house_no})
-                tenant_data = cursor.fetchone()
-
-            if tenant_data:                
-                self.destroy() 
-                tenant_app = TenantApp(self.tenant_manager, self.db_connection,house_no)  
-                tenant_app.mainloop()
-            else:
-                messagebox.showerror("Login Failed", "Invalid house number.")
+                self._login_cur.execute(None, h=house_no)
+                tenant_data = self._login_cur.fetchone()
         except cx_Oracle.DatabaseError as e:
             print("Database error:", e)
             messagebox.showerror("Login Failed", "An error occurred while checking credentials.")
+            return
+
+        if tenant_data:                
+            self.destroy() 
+            tenant_app = TenantApp(self.tenant_manager, self.db,house_no)  
+            tenant_app.mainloop()
+        else:
+            messagebox.showerror("Login Failed", "Invalid house number.")
 
       
 
-class TenantApp(tk.Tk):
+class TenantApp(BackgroundWorkerMixin, tk.Tk):
     
-    def __init__(self, tenant_manager, db_connection, house_no):
+    def __init__(self, tenant_manager, db, house_no):
         super().__init__()
         self.tenant_manager = tenant_manager
-        self.db_connection = db_connection
+        self.db = db
         self.house_no = house_no  
+        self.start_executor()
         self.title("Tenant Dashboard")
         self.geometry("400x400")
 
@@ -349,21 +692,22 @@ class TenantApp(tk.Tk):
 
     def view_due_amount(self):
         house_no = self.house_no 
-        cursor = self.db_connection.cursor()
-        try:
-            cursor.execute("SELECT due_amount FROM Tenant WHERE house_no = :house_no", {'house_no': house_no})
-            due_amount_data = cursor.fetchone()
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT due_amount FROM Tenant WHERE house_no = :house_no", {'house_no': house_no})
+                due_amount_data = cursor.fetchone()
 
-            if due_amount_data:
-                due_amount = due_amount_data[0]
-                messagebox.showinfo("Due Amount", f"The due amount for tenant with house number {house_no} is: {due_amount}")
-            else:
-                messagebox.showerror("No Data Found", f"No tenant found with house number {house_no}.")
-        except cx_Oracle.DatabaseError as e:
-            print("Database error:", e)
-            messagebox.showerror("Database Error", "An error occurred while retrieving the due amount.")
-        finally:
-            cursor.close()
+                if due_amount_data:
+                    due_amount = due_amount_data[0]
+                    messagebox.showinfo("Due Amount", f"The due amount for tenant with house number {house_no} is: {due_amount}")
+                else:
+                    messagebox.showerror("No Data Found", f"No tenant found with house number {house_no}.")
+            except cx_Oracle.DatabaseError as e:
+                print("Database error:", e)
+                messagebox.showerror("Database Error", "An error occurred while retrieving the due amount.")
+            finally:
+                cursor.close()
 
     def view_payment_history_gui(self):
         history_window = tk.Toplevel(self)
@@ -373,27 +717,45 @@ class TenantApp(tk.Tk):
         self.view_payment_history(house_no, history_window)  
 
     def view_payment_history(self, house_no, history_window):
-        
-        cursor = self.db_connection.cursor()
-        try:
-           
-            for widget in history_window.winfo_children():
-                widget.destroy()  
-
-            cursor.execute("SELECT payment_id, payment_date, amount_paid, payment_method FROM SYSTEM.Payment WHERE house_no = :1", (house_no,))
-            rows = cursor.fetchall()
-
-            if rows:
-                row_num = 0  
-                for row in rows:
-                    tk.Label(history_window, text=f"Payment ID: {row[0]}, Date: {row[1]}, Amount: {row[2]}, Method: {row[3]}").grid(row=row_num, column=0, padx=5, pady=5, columnspan=2, sticky="w")
-                    row_num += 1
-            else:
-                tk.Label(history_window, text="No payment history found.").grid(row=0, column=0, padx=5, pady=5, columnspan=2, sticky="w")
-        except cx_Oracle.DatabaseError as e:
-            messagebox.showerror("Error", "Error fetching payment history: " + str(e))
-        finally:
-            cursor.close()
+        self.run_in_background(
+            lambda: self.fetch_payment_history(house_no),
+            lambda rows: self.show_payment_history(history_window, rows),
+            lambda e: messagebox.showerror("Error", "Error fetching payment history: " + str(e))
+        )
+
+    def fetch_payment_history(self, house_no):
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            cursor.arraysize = 500
+            cursor.prefetchrows = 501
+            try:
+                cursor.execute("SELECT payment_id, payment_date, amount_paid, payment_method FROM SYSTEM.Payment WHERE house_no = :1", (house_no,))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def show_payment_history(self, history_window, rows):
+        if not history_window.winfo_exists():
+            return
+        if not rows:
+            tk.Label(history_window, text="No payment history found.").grid(row=0, column=0, padx=5, pady=5, columnspan=2, sticky="w")
+            return
+
+        columns = ("Payment ID", "Date", "Amount", "Method")
+        tree = ttk.Treeview(history_window, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=120, anchor="w")
+        scroll = ttk.Scrollbar(history_window, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scroll.set)
+        tree.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
+        scroll.grid(row=0, column=1, pady=5, sticky="ns")
+        history_window.grid_rowconfigure(0, weight=1)
+        history_window.grid_columnconfigure(0, weight=1)
+
+        for row in rows:
+            tree.insert("", "end", values=row)
+
     def make_payment_gui(self):
         payment_window = tk.Toplevel(self)
         payment_window.title("Make Payment")
@@ -415,7 +777,7 @@ class TenantApp(tk.Tk):
         tk.Label(payment_window, text="Payment Method").grid(row=3, column=0, padx=5, pady=5)
         payment_method_var = tk.StringVar(payment_window)
         payment_method_var.set("Credit Card")  
-        payment_method_menu = tk.OptionMenu(payment_window, payment_method_var, "Credit Card", "Cash", "Bank Transfer")
+        payment_method_menu = tk.OptionMenu(payment_window, payment_method_var, *PAYMENT_STRATEGIES)
         payment_method_menu.grid(row=3, column=1, padx=5, pady=5)
 
         def process_payment():
@@ -423,13 +785,8 @@ class TenantApp(tk.Tk):
             amount_paid = amount_paid_entry.get()
             payment_method = payment_method_var.get()
 
-            if payment_method == "Credit Card":
-                strategy = CreditCardPayment()
-            elif payment_method == "Cash":
-                strategy = CashPayment()
-            elif payment_method == "Bank Transfer":
-                strategy = BankTransferPayment()
-            else:
+            strategy = PAYMENT_STRATEGIES.get(payment_method)
+            if strategy is None:
                 messagebox.showerror("Error", "Invalid payment method")
                 return
 
@@ -439,31 +796,45 @@ class TenantApp(tk.Tk):
         tk.Button(payment_window, text="Submit Payment", command=process_payment).grid(row=4, columnspan=2, pady=10)
 
     def make_payment(self, house_no, payment_date, amount_paid, payment_method):
-        cursor = self.db_connection.cursor()
-        try:
-            cursor.execute("SELECT * FROM SYSTEM.Tenant WHERE house_no = :1", (house_no,))
-            result = cursor.fetchone()
-            if result is not None:
-                cursor.execute(
-                    "INSERT INTO SYSTEM.Payment (house_no, payment_date, amount_paid, payment_method) "
-                    "VALUES (:1, TO_DATE(:2, 'YYYY-MM-DD'), :3, :4)",
-                    (house_no, payment_date, amount_paid, payment_method)
-                )
-                cursor.execute(
-                    "UPDATE SYSTEM.Tenant "
-                    "SET due_amount = due_amount - :1 "
-                    "WHERE house_no = :2",
-                    (amount_paid, house_no)
+        self.run_in_background(
+            lambda: self.record_payment(house_no, payment_date, amount_paid, payment_method),
+            self.payment_recorded,
+            lambda e: messagebox.showerror("Error", "Error recording payment: " + str(e))
+        )
+
+    def record_payment(self, house_no, payment_date, amount_paid, payment_method):
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                # The update doubles as the tenant check; payment_id stays NULL when no tenant matched
+                payment_id = cursor.var(int)
+                cursor.execute("""
+                    BEGIN
+                        UPDATE SYSTEM.Tenant SET due_amount = due_amount - :amount_paid WHERE house_no = :house_no;
+                        IF SQL%ROWCOUNT > 0 THEN
+                            INSERT INTO SYSTEM.Payment (house_no, payment_date, amount_paid, payment_method)
+                                VALUES (:house_no, TO_DATE(:payment_date, 'YYYY-MM-DD'), :amount_paid, :payment_method)
+                                RETURNING payment_id INTO :payment_id;
+                        END IF;
+                    END;""",
+                    house_no=house_no, payment_date=payment_date, amount_paid=amount_paid,
+                    payment_method=payment_method, payment_id=payment_id
                 )
-                self.db_connection.commit()
-                messagebox.showinfo("Success", "Payment recorded successfully!")
-            else:
-                messagebox.showwarning("Warning", "No tenant found with that house number.")
-        except cx_Oracle.DatabaseError as e:
-            messagebox.showerror("Error", "Error recording payment: " + str(e))
-            self.db_connection.rollback()
-        finally:
-            cursor.close()
+                if payment_id.getvalue() is None:
+                    return None
+                connection.commit()
+                return payment_id.getvalue()
+            except cx_Oracle.DatabaseError:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def payment_recorded(self, payment_id):
+        if payment_id is not None:
+            messagebox.showinfo("Success", f"Payment recorded successfully! Payment ID: {payment_id}")
+        else:
+            messagebox.showwarning("Warning", "No tenant found with that house number.")
 
     def request_maintenance_gui(self):
         maintenance_window = tk.Toplevel(self)
@@ -494,48 +865,113 @@ class TenantApp(tk.Tk):
         tk.Button(maintenance_window, text="Submit Request", command=submit_request).grid(row=3, columnspan=2, pady=10)
 
     def request_maintenance(self, apartment_id, house_no, issue_description):
-        cursor = self.db_connection.cursor()
-        try:
-            cursor.execute("SELECT * FROM SYSTEM.Tenant WHERE house_no = :1", (house_no,))
-            result = cursor.fetchone()
+        self.run_in_background(
+            lambda: self.record_maintenance_request(apartment_id, house_no, issue_description),
+            self.maintenance_request_recorded,
+            lambda e: messagebox.showerror("Error", "Error executing query: " + str(e))
+        )
 
-            if result is not None:
+    def record_maintenance_request(self, apartment_id, house_no, issue_description):
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
                 cursor.execute(
                     "INSERT INTO SYSTEM.Maintenance(apartment_id, house_no, issue_description, request_date) "
-                    "VALUES (:1, :2, :3, SYSDATE)",
-                    (apartment_id, house_no, issue_description)
+                    "SELECT :apartment_id, :house_no, :issue_description, SYSDATE FROM DUAL "
+                    "WHERE EXISTS (SELECT 1 FROM SYSTEM.Tenant WHERE house_no = :house_no)",
+                    {'apartment_id': apartment_id, 'house_no': house_no, 'issue_description': issue_description}
                 )
-                self.db_connection.commit()
-                messagebox.showinfo("Success", "Maintenance request submitted successfully!")
-            else:
-                messagebox.showwarning("Warning", "No tenant found with that house number.")
-        except cx_Oracle.DatabaseError as e:
-            messagebox.showerror("Error", "Error executing query: " + str(e))
-            self.db_connection.rollback()
-        finally:
-            cursor.close()
+                if cursor.rowcount == 0:
+                    return False
+                connection.commit()
+                return True
+            except cx_Oracle.DatabaseError:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def maintenance_request_recorded(self, recorded):
+        if recorded:
+            messagebox.showinfo("Success", "Maintenance request submitted successfully!")
+        else:
+            messagebox.showwarning("Warning", "No tenant found with that house number.")
 
 
 
-class AdminApp(tk.Tk):
-    def __init__(self, tenant_manager,connection):
-        self.connection = connection
+class AdminApp(BackgroundWorkerMixin, tk.Tk):
+    # The complaints join is reused for CACHE_TTL seconds unless a write invalidates it
+    CACHE_TTL = 30
+
+    def __init__(self, tenant_manager, db):
+        self.db = db
         super().__init__()
         self.tenant_manager = tenant_manager
+        self._cache_lock = threading.Lock()
+        # (timestamp, {offset: rows}) for one snapshot of the complaints list
+        self._complaints_cache = None
+        self._complaints_generation = 0
+        self.start_executor()
+
+        # Lookups run on one held pooled connection with their statements prepared once;
+        # workers share these cursors, so each use is taken under _query_lock
+        self._query_lock = threading.Lock()
+        self._query_connection = contextlib.ExitStack()
+        connection = self._query_connection.enter_context(self.db.get_connection())
+        # Columns are selected in display order so rows go straight into the tree
+        self._cur_complaints = connection.cursor()
+        self._cur_complaints.arraysize = 1000
+        self._cur_complaints.prefetchrows = 1001
+        self._cur_complaints.prepare("""SELECT a.apartment_name, m.house_no, m.issue_description, m.request_date, m.status,
+                                        t.tenant_name, t.phone_number, a.address
+                                FROM Maintenance m
+                                JOIN Tenant t ON m.house_no = t.house_no
+                                JOIN Apartment a ON m.apartment_id = a.apartment_id
+                                ORDER BY m.request_date DESC, m.apartment_id, m.house_no
+                                OFFSET :o ROWS FETCH NEXT :l ROWS ONLY""")
+        self._cur_latest = connection.cursor()
+        self._cur_latest.arraysize = 1000
+        self._cur_latest.prefetchrows = 1001
+        # One pass down change_date, keeping every row tied for the newest timestamp
+        self._cur_latest.prepare('''SELECT audit_id, house_no, action, change_date
+                                FROM Audit_Tenant
+                                ORDER BY change_date DESC
+                                FETCH FIRST 1 ROWS WITH TIES''')
         self.title("Tenant Management System")
         self.geometry("400x350")
         
         menubar = tk.Menu(self)
         self.config(menu=menubar)
         
-        self.add_frame = tk.Frame(self)
-        self.update_frame = tk.Frame(self)
-        self.delete_frame = tk.Frame(self)
-        self.list_frame = tk.Frame(self)
-        self.tenant_frame = tk.Frame(self)
-        self.provide_frame = tk.Frame(self)
-        self.complaints_frame = tk.Frame(self)
-        self.latest_frame = tk.Frame(self)
+        # Every view is built once and stacked in the same grid cell; switching views raises one
+        container = tk.Frame(self)
+        container.pack(fill="both", expand=True)
+        container.grid_rowconfigure(0, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+
+        self.home_frame = tk.Frame(container)
+        self.add_frame = tk.Frame(container)
+        self.update_frame = tk.Frame(container)
+        self.delete_frame = tk.Frame(container)
+        self.list_frame = tk.Frame(container)
+        self.tenant_frame = tk.Frame(container)
+        self.provide_frame = tk.Frame(container)
+        self.complaints_frame = tk.Frame(container)
+        self.latest_frame = tk.Frame(container)
+        for frame in (self.home_frame, self.add_frame, self.update_frame, self.delete_frame, self.list_frame,
+                      self.tenant_frame, self.provide_frame, self.complaints_frame, self.latest_frame):
+            frame.grid(row=0, column=0, sticky="nsew")
+
+        self.create_apartment_widgets()
+        self.create_add_widgets()
+        self.create_update_widgets()
+        self.create_delete_widgets()
+        self.create_provide_widgets()
+        self.create_tenant_list_widgets()
+        self.create_complaint_widgets()
+        self.create_latest_widgets()
+        self._active_frame = None
+        self._show(self.home_frame)
 
         tenant_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="MENU", menu=tenant_menu)
@@ -549,247 +985,204 @@ class AdminApp(tk.Tk):
         tenant_menu.add_command(label="Display Latest Modifications", command=self.display_latest_modifications_gui)
         tenant_menu.add_command(label="Logout", command=self.destroy)
 
-    def show_list_apartments(self):
-        self.add_frame.pack_forget()
-        self.update_frame.pack_forget()
-        self.delete_frame.pack_forget()
-        self.provide_frame.pack_forget()
-        self.tenant_frame.pack_forget()
-        self.complaints_frame.pack_forget()
-        self.latest_frame.pack_forget()
-        self.list_frame.pack(fill="both", expand=True)
-        
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
+    def destroy(self):
+        super().destroy()
+        with self._query_lock:
+            for cursor in (self._cur_complaints, self._cur_latest):
+                cursor.close()
+            self._query_connection.close()
+
+    # Only the frame on top is visible, so a switch is one raise and re-showing the current view is free
+    def _show(self, frame):
+        if self._active_frame is not frame:
+            frame.tkraise()
+            self._active_frame = frame
+
+    def create_apartment_widgets(self):
+        self.apartment_tree = ttk.Treeview(self.list_frame, columns=("Apartment ID", "Apartment Name", "Address", "Rooms", "Rent"), show="headings")
+        self.apartment_tree.heading("Apartment ID", text="Apartment ID")
+        self.apartment_tree.heading("Apartment Name", text="Apartment Name")
+        self.apartment_tree.heading("Address", text="Address")
+        self.apartment_tree.heading("Rooms", text="Rooms")
+        self.apartment_tree.heading("Rent", text="Rent")
+        self.apartment_tree.pack(fill="both", expand=True)
+        self._apartments_request = 0
 
-        self.treeview = ttk.Treeview(self.list_frame, columns=("Apartment ID", "Apartment Name", "Address", "Rooms", "Rent"), show="headings")
-        self.treeview.heading("Apartment ID", text="Apartment ID")
-        self.treeview.heading("Apartment Name", text="Apartment Name")
-        self.treeview.heading("Address", text="Address")
-        self.treeview.heading("Rooms", text="Rooms")
-        self.treeview.heading("Rent", text="Rent")
-        self.treeview.pack(fill="both", expand=True)
+    def show_list_apartments(self):
+        self._show(self.list_frame)
+        self.apartment_tree.delete(*self.apartment_tree.get_children())
+
+        # A newer listing supersedes this one: its stream stops and batches already queued are dropped
+        self._apartments_request += 1
+        request = self._apartments_request
+        is_current = lambda: request == self._apartments_request
+
+        list_apartments_cmd = ListApartmentsCommand(self.db)
+        treeview = self.apartment_tree
+        self.stream_in_background(
+            list_apartments_cmd.execute(),
+            lambda apartments: is_current() and self.insert_rows(treeview, apartments),
+            lambda count: is_current() and self.apartments_listed(count),
+            is_current=is_current
+        )
 
-        list_apartments_cmd = ListApartmentsCommand(self.connection)
-        apartments = list_apartments_cmd.execute() 
-        if apartments:
-            for apartment in apartments:
-                self.treeview.insert("", "end", values=apartment)
-        else:
+    def apartments_listed(self, count):
+        if not count:
             print("No apartments available to display.")
 
+    def insert_rows(self, treeview, rows):
+        if not treeview.winfo_exists():
+            return
+        for row in rows:
+            treeview.insert("", "end", values=row)
+        self.update_idletasks()
+
 
     def show_add_tenant(self):
-        self.list_frame.pack_forget()
-        self.latest_frame.pack_forget()
-        self.update_frame.pack_forget()
-        self.delete_frame.pack_forget()
-        self.tenant_frame.pack_forget()
-        self.provide_frame.pack_forget()
-        self.complaints_frame.pack_forget()
-        self.add_frame.pack(fill="both", expand=True)
-        self.create_add_widgets()
+        self._show(self.add_frame)
 
     def show_update_tenant(self):
-        self.latest_frame.pack_forget()
-        self.list_frame.pack_forget()
-        self.add_frame.pack_forget()
-        self.delete_frame.pack_forget()
-        self.provide_frame.pack_forget()
-        self.tenant_frame.pack_forget()
-        self.complaints_frame.pack_forget()
-        self.update_frame.pack(fill="both", expand=True)
-        self.create_update_widgets()
+        self._show(self.update_frame)
         
     def show_delete_tenant(self):
-        self.latest_frame.pack_forget()
-        self.list_frame.pack_forget()
-        self.update_frame.pack_forget()
-        self.add_frame.pack_forget()
-        self.provide_frame.pack_forget()
-        self.tenant_frame.pack_forget()
-        self.complaints_frame.pack_forget()
-        self.delete_frame.pack(fill="both",expand=True)
-        self.create_delete_widgets()
+        self._show(self.delete_frame)
     
-    def create_add_widgets(self):
-        for widget in self.add_frame.winfo_children():
-            widget.destroy()
-        
-        tk.Label(self.add_frame, text="Add Tenant").grid(row=0, column=0, columnspan=2, pady=10)
-        tk.Label(self.add_frame, text="House No:").grid(row=1, column=0, padx=10, pady=5)
-        self.house_no_entry = tk.Entry(self.add_frame)
-        self.house_no_entry.grid(row=1, column=1, padx=10, pady=5)
-
-        tk.Label(self.add_frame, text="Tenant Name:").grid(row=2, column=0, padx=10, pady=5)
-        self.tenant_name_entry = tk.Entry(self.add_frame)
-        self.tenant_name_entry.grid(row=2, column=1, padx=10, pady=5)
-
-        tk.Label(self.add_frame, text="Phone Number:").grid(row=3, column=0, padx=10, pady=5)
-        self.phone_entry = tk.Entry(self.add_frame)
-        self.phone_entry.grid(row=3, column=1, padx=10, pady=5)
-
-        tk.Label(self.add_frame, text="Apartment ID:").grid(row=4, column=0, padx=10, pady=5)
-        self.apartment_id_entry = tk.Entry(self.add_frame)
-        self.apartment_id_entry.grid(row=4, column=1, padx=10, pady=5)
+    # Builds the shared add/update tenant form and returns its entries keyed by field
+    def create_tenant_form(self, frame, title, command):
+        tk.Label(frame, text=title).grid(row=0, column=0, columnspan=2, pady=10)
+        fields = [
+            ("house_no", "House No:"),
+            ("tenant_name", "Tenant Name:"),
+            ("phone_number", "Phone Number:"),
+            ("apartment_id", "Apartment ID:"),
+            ("move_in_date", "Move-in Date (YYYY-MM-DD):"),
+        ]
+        entries = {}
+        for row, (field, label) in enumerate(fields, start=1):
+            tk.Label(frame, text=label).grid(row=row, column=0, padx=10, pady=5)
+            entries[field] = tk.Entry(frame)
+            entries[field].grid(row=row, column=1, padx=10, pady=5)
 
-        tk.Label(self.add_frame, text="Move-in Date (YYYY-MM-DD):").grid(row=5, column=0, padx=10, pady=5)
-        self.move_in_date_entry = tk.Entry(self.add_frame)
-        self.move_in_date_entry.grid(row=5, column=1, padx=10, pady=5)
+        tk.Button(frame, text=title, command=command).grid(row=6, column=0, columnspan=2, pady=10)
+        return entries
 
-        tk.Button(self.add_frame, text="Add Tenant", command=self.add_tenant).grid(row=6, column=0, columnspan=2, pady=10)
+    def create_add_widgets(self):
+        self.add_entries = self.create_tenant_form(self.add_frame, "Add Tenant", self.add_tenant)
 
     def create_update_widgets(self):
-        for widget in self.update_frame.winfo_children():
-            widget.destroy()
-        
-        tk.Label(self.update_frame, text="Update Tenant").grid(row=0, column=0, columnspan=2, pady=10)
-        tk.Label(self.update_frame, text="House No:").grid(row=1, column=0, padx=10, pady=5)
-        self.house_no_entry = tk.Entry(self.update_frame)
-        self.house_no_entry.grid(row=1, column=1, padx=10, pady=5)
-
-        tk.Label(self.update_frame, text="Tenant Name:").grid(row=2, column=0, padx=10, pady=5)
-        self.tenant_name_entry = tk.Entry(self.update_frame)
-        self.tenant_name_entry.grid(row=2, column=1, padx=10, pady=5)
-
-        tk.Label(self.update_frame, text="Phone Number:").grid(row=3, column=0, padx=10, pady=5)
-        self.phone_entry = tk.Entry(self.update_frame)
-        self.phone_entry.grid(row=3, column=1, padx=10, pady=5)
-
-        tk.Label(self.update_frame, text="Apartment ID:").grid(row=4, column=0, padx=10, pady=5)
-        self.apartment_id_entry = tk.Entry(self.update_frame)
-        self.apartment_id_entry.grid(row=4, column=1, padx=10, pady=5)
-
-        tk.Label(self.update_frame, text="Move-in Date (YYYY-MM-DD):").grid(row=5, column=0, padx=10, pady=5)
-        self.move_in_date_entry = tk.Entry(self.update_frame)
-        self.move_in_date_entry.grid(row=5, column=1, padx=10, pady=5)
-
-        tk.Button(self.update_frame, text="Update Tenant", command=self.update_tenant).grid(row=6, column=0, columnspan=2, pady=10)
+        self.update_entries = self.create_tenant_form(self.update_frame, "Update Tenant", self.update_tenant)
 
     def create_delete_widgets(self):
-        for widget in self.delete_frame.winfo_children():
-            widget.destroy()
-        
         tk.Label(self.delete_frame, text="Delete Tenant").grid(row=0, column=0, columnspan=2, pady=10)
         tk.Label(self.delete_frame, text="House No:").grid(row=1, column=0, padx=10, pady=5)
-        self.house_no_entry = tk.Entry(self.delete_frame)
-        self.house_no_entry.grid(row=1, column=1, padx=10, pady=5)
+        self.delete_house_no_entry = tk.Entry(self.delete_frame)
+        self.delete_house_no_entry.grid(row=1, column=1, padx=10, pady=5)
 
         tk.Button(self.delete_frame, text="Delete Tenant", command=self.delete_tenant).grid(row=6, column=0, columnspan=2, pady=10)
     
-    def add_tenant(self):
-        house_no = self.house_no_entry.get()
-        tenant_name = self.tenant_name_entry.get()
-        phone_number = self.phone_entry.get()
-        apartment_id = self.apartment_id_entry.get()
-        move_in_date_str = self.move_in_date_entry.get()
+    # Reads a tenant form and returns it as a TenantRow; raises ValueError before any database work
+    def _validate_tenant_form(self, entries):
+        house_no = entries['house_no'].get()
+        tenant_name = entries['tenant_name'].get()
+        phone_number = entries['phone_number'].get()
+        apartment_id = entries['apartment_id'].get()
+        move_in_date_str = entries['move_in_date'].get()
 
         if not (house_no and tenant_name and phone_number and apartment_id and move_in_date_str):
-            messagebox.showwarning("Input Error", "All fields must be filled.")
-            return
-
+            raise ValueError("All fields must be filled.")
+        try:
+            apartment_id = int(apartment_id)
+        except ValueError:
+            raise ValueError("Apartment ID must be a number.") from None
         try:
-            move_in_date = datetime.datetime.strptime(move_in_date_str, '%Y-%m-%d').date()
+            move_in_date = parse_move_in_date(move_in_date_str)
         except ValueError:
-            messagebox.showerror("Date Error", "Move-in date must be in the format YYYY-MM-DD.")
+            raise ValueError("Move-in date must be in the format YYYY-MM-DD.") from None
+        return TenantRow(house_no, tenant_name, phone_number, apartment_id, move_in_date)
+
+    def add_tenant(self):
+        try:
+            tenant = self._validate_tenant_form(self.add_entries)
+        except ValueError as e:
+            messagebox.showwarning("Input Error", str(e))
             return
 
-        add_tenant_cmd = AddTenantCommand(
-            db_connection_instance.get_connection(),
-            house_no, tenant_name, phone_number, int(apartment_id), move_in_date
+        add_tenant_cmd = AddTenantCommand.from_single(self.db, *tenant)
+        def work():
+            self.tenant_manager.add_tenant(add_tenant_cmd)
+            self.tenant_manager.flush_observers()
+            self.invalidate_complaints()
+            return add_tenant_cmd.errors
+
+        self.run_in_background(
+            work,
+            self.tenant_added,
+            lambda e: messagebox.showerror("Error", f"Error adding tenant: {e}")
         )
-        self.tenant_manager.add_tenant(add_tenant_cmd)
-        messagebox.showinfo("Success", "Tenant added successfully")
-
-    def update_tenant(self):
-        house_no = self.house_no_entry.get()
-        tenant_name = self.tenant_name_entry.get()
-        phone_number = self.phone_entry.get()
-        apartment_id = self.apartment_id_entry.get()
-        move_in_date_str = self.move_in_date_entry.get()
 
-        if not (house_no and tenant_name and phone_number and apartment_id and move_in_date_str):
-            messagebox.showwarning("Input Error", "All fields must be filled.")
-            return
+    # Rejected rows (duplicate house_no, unknown apartment_id, ...) come back as batch errors, not exceptions
+    def tenant_added(self, errors):
+        if errors:
+            messagebox.showerror("Error", f"Error adding tenant: {errors[0].message}")
+        else:
+            messagebox.showinfo("Success", "Tenant added successfully")
 
+    def update_tenant(self):
         try:
-            move_in_date = datetime.datetime.strptime(move_in_date_str, '%Y-%m-%d').date()
-        except ValueError:
-            messagebox.showerror("Date Error", "Move-in date must be in the format YYYY-MM-DD.")
+            tenant = self._validate_tenant_form(self.update_entries)
+        except ValueError as e:
+            messagebox.showwarning("Input Error", str(e))
             return
 
-        update_tenant_cmd = UpdateTenantCommand(
-            db_connection_instance.get_connection(),
-            house_no, tenant_name, phone_number, int(apartment_id), move_in_date
+        update_tenant_cmd = UpdateTenantCommand(self.db, *tenant)
+        def work():
+            self.tenant_manager.update_tenant(update_tenant_cmd)
+            self.tenant_manager.flush_observers()
+            self.invalidate_complaints()
+
+        self.run_in_background(
+            work,
+            lambda _: messagebox.showinfo("Success", "Tenant updated successfully"),
+            lambda e: messagebox.showerror("Error", f"Error updating tenant: {e}")
         )
-        self.tenant_manager.update_tenant(update_tenant_cmd)
-        messagebox.showinfo("Success", "Tenant updated successfully")
 
     def delete_tenant(self):
-        house_no = self.house_no_entry.get()
+        house_no = self.delete_house_no_entry.get()
 
         if not house_no:
             messagebox.showwarning("Input Error", "Fields must not be empty")
             return
 
-        tenant_data = self.fetch_tenant_details(house_no)
-        if not tenant_data:
-            messagebox.showwarning("Error", "Tenant not found")
-            return
-
-        delete_tenant_cmd = DeleteTenantCommand(
-            db_connection_instance.get_connection(),
-            house_no
+        def work():
+            delete_tenant_cmd = DeleteTenantCommand(
+                self.db,
+                house_no
+            )
+            self.tenant_manager.delete_tenant(delete_tenant_cmd)
+            self.tenant_manager.flush_observers()
+            self.invalidate_complaints()
+            return delete_tenant_cmd.tenant_data is not None
+
+        self.run_in_background(
+            work,
+            self.tenant_deleted,
+            lambda e: messagebox.showerror('Error', f"Error deleting tenant: {str(e)}")
         )
 
-        observer = AuditLogger(db_connection_instance.get_connection())
-        observer.update('DELETE', tenant_data) 
-
-        try:
-            self.tenant_manager.delete_tenant(delete_tenant_cmd)
+    def tenant_deleted(self, deleted):
+        if deleted:
             messagebox.showinfo('Success', 'Tenant deleted successfully')
-        except Exception as e:
-            messagebox.showerror('Error', f"Error deleting tenant: {str(e)}")
-
-    def fetch_tenant_details(self, house_no):
-        cursor = None
-        try:
-            cursor = db_connection_instance.get_connection().cursor()
-            cursor.execute("""
-                SELECT tenant_name, phone_number, apartment_id, move_in_date
-                FROM Tenant WHERE house_no = :1
-            """, (house_no,))
-            tenant_data = cursor.fetchone()
-            if tenant_data:
-                return {
-                    'house_no': house_no,
-                    'tenant_name': tenant_data[0],
-                    'phone_number': tenant_data[1],
-                    'apartment_id': tenant_data[2],
-                    'move_in_date': tenant_data[3]
-                }
-            return None 
-        except cx_Oracle.DatabaseError as e:
-            print(f"Error fetching tenant details: {e}")
-        finally:
-            if cursor:
-                cursor.close()
+        else:
+            messagebox.showwarning("Error", "Tenant not found")
 
-    def show_list_tenants(self):
-      
-        self.latest_frame.pack_forget()
-        self.complaints_frame.pack_forget()
-        self.add_frame.pack_forget()
-        self.update_frame.pack_forget()
-        self.delete_frame.pack_forget()
-        self.provide_frame.pack_forget()
-        self.tenant_frame.pack_forget()
-        self.list_frame.pack(fill="both", expand=True)
-        
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
+    # Tenant changes show up in the complaints join, so they drop its cache too
+    def invalidate_complaints(self):
+        with self._cache_lock:
+            self._complaints_cache = None
+            self._complaints_generation += 1
 
-        self.treeview = ttk.Treeview(self.list_frame, columns=("House No", "Tenant Name", "Phone", "Apartment ID", "Move-In Date", "Due Amount"), show="headings")
+    def create_tenant_list_widgets(self):
+        self.treeview = ttk.Treeview(self.tenant_frame, columns=("House No", "Tenant Name", "Phone", "Apartment ID", "Move-In Date", "Due Amount"), show="headings")
         
         self.treeview.heading("House No", text="House No")
         self.treeview.heading("Tenant Name", text="Tenant Name")
@@ -797,33 +1190,30 @@ class AdminApp(tk.Tk):
         self.treeview.heading("Apartment ID", text="Apartment ID")
         self.treeview.heading("Move-In Date", text="Move-In Date")
         self.treeview.heading("Due Amount", text="Due Amount")
-        self.treeview.pack(fill="both", expand=True)
 
-        list_tenants_cmd = ListTenantsCommand(self.connection)
-        tenants = list_tenants_cmd.execute()
+        tenant_scroll = tk.Scrollbar(self.tenant_frame, orient="vertical", command=self.treeview.yview)
+        tenant_scroll.pack(side="right", fill="y")
+        self.treeview.pack(fill="both", expand=True)
 
-        if tenants is None:
-            messagebox.showerror("Error", "Failed to fetch tenant data.")
-            return
+        self.tenant_pager = TreePager(
+            self, self.treeview, tenant_scroll, self.fetch_tenants_page,
+            lambda e: messagebox.showerror("Error", "Failed to fetch tenant data.")
+        )
 
-        for tenant in tenants:
-            self.treeview.insert("", "end", values=tenant)
+    def show_list_tenants(self):
+        self._show(self.tenant_frame)
+        self.tenant_pager.reset()
+        self.tenant_pager.load_more()
 
+    def fetch_tenants_page(self, offset, limit):
+        list_tenants_cmd = ListTenantsCommand(self.db, offset, limit)
+        return [tenant for tenants in list_tenants_cmd.execute() for tenant in tenants]
 
     # Maintenance Service GUI
     def provide_service_gui(self):
-        frames = [
-            self.list_frame,self.latest_frame, self.complaints_frame, self.add_frame,
-            self.update_frame, self.delete_frame, self.tenant_frame
-        ]
-        for frame in frames:
-            if frame.winfo_ismapped():
-                frame.pack_forget()
-        self.provide_frame.pack(fill="both", expand=True)
-
-        for widget in self.provide_frame.winfo_children():
-            widget.destroy()
+        self._show(self.provide_frame)
 
+    def create_provide_widgets(self):
         tk.Label(self.provide_frame, text="Apartment ID").grid(row=0, column=0, padx=5, pady=5)
         apartment_id_entry = tk.Entry(self.provide_frame)
         apartment_id_entry.grid(row=0, column=1, padx=5, pady=5)
@@ -836,150 +1226,122 @@ class AdminApp(tk.Tk):
             apartment_id = apartment_id_entry.get()
             house_no = house_no_entry.get()
 
-            result_message = self.provide_service(self.connection, apartment_id, house_no, lambda msg: messagebox.showerror("Error", msg))
-            if result_message:
-                messagebox.showinfo("Success", result_message)
+            def work():
+                result_message = self.provide_service(apartment_id, house_no, lambda msg: self.post(messagebox.showerror, "Error", msg))
+                self.invalidate_complaints()
+                return result_message
+
+            self.run_in_background(
+                work,
+                lambda result_message: result_message and messagebox.showinfo("Success", result_message)
+            )
 
         tk.Button(self.provide_frame, text="Provide Service", command=provide).grid(row=2, columnspan=2, pady=10)
 
-    def provide_service(self, connection, apartment_id, house_no, error_callback):
-        cursor = connection.cursor()
-        try:
-            if self.check_complaint(connection, apartment_id, house_no):
-                if self.incomplete_complaint(connection, apartment_id, house_no):
-                    issues_fixed = []
-                    cursor.execute("SELECT issue_description FROM SYSTEM.Maintenance WHERE apartment_id = :1 AND house_no = :2", (apartment_id, house_no))
-                    rows = cursor.fetchall()
-                    for row in rows:
-                        issues_fixed.append(row[0])
-                    if issues_fixed:
-                        cursor.execute(
-                            "UPDATE SYSTEM.Maintenance "
-                            "SET status ='Completed' WHERE apartment_id = :1 AND house_no = :2",
-                            (apartment_id, house_no)
-                        )
-                        cursor.execute(
-                            "UPDATE SYSTEM.Tenant "
-                            "SET due_amount = due_amount + 100 "
-                            "WHERE house_no = :1",
-                            (house_no,)
-                        )
-                        connection.commit()
-                        return f"Maintenance Service Completed for Apartment ID: {apartment_id}, House No: {house_no}. Issues Fixed: {', '.join(issues_fixed)}"
-                    else:
-                        return "No issues found to fix."
-                else:
+    def provide_service(self, apartment_id, house_no, error_callback):
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                # Checks for complaints, lists the open issues and closes them in one round-trip
+                issues = cursor.var(str, 4000)
+                outcome = cursor.var(str, 10)
+                cursor.execute("""
+                    DECLARE
+                        v_found NUMBER;
+                        v_issues VARCHAR2(4000);
+                    BEGIN
+                        -- Long lists are cut short with a count of the omitted issues instead of raising ORA-01489
+                        SELECT LISTAGG(issue_description, ', ' ON OVERFLOW TRUNCATE '...' WITH COUNT)
+                                   WITHIN GROUP (ORDER BY request_date)
+                          INTO v_issues
+                          FROM SYSTEM.Maintenance
+                         WHERE apartment_id = :apartment_id AND house_no = :house_no AND status != 'Completed';
+                        IF v_issues IS NOT NULL THEN
+                            UPDATE SYSTEM.Maintenance SET status = 'Completed'
+                             WHERE apartment_id = :apartment_id AND house_no = :house_no AND status != 'Completed';
+                            UPDATE SYSTEM.Tenant SET due_amount = due_amount + 100 WHERE house_no = :house_no;
+                            :issues := v_issues;
+                            :outcome := 'FIXED';
+                        ELSE
+                            -- Nothing open: stop at the first matching row to tell "none" from "all done"
+                            SELECT COUNT(*) INTO v_found
+                              FROM SYSTEM.Maintenance
+                             WHERE apartment_id = :apartment_id AND house_no = :house_no AND ROWNUM = 1;
+                            IF v_found = 0 THEN
+                                :outcome := 'NONE';
+                            ELSE
+                                :outcome := 'DONE';
+                            END IF;
+                        END IF;
+                    END;""",
+                    apartment_id=apartment_id, house_no=house_no, issues=issues, outcome=outcome
+                )
+                if outcome.getvalue() == 'NONE':
+                    return "No complaint registered for this apartment."
+                if outcome.getvalue() == 'DONE':
                     return "Maintenance service already completed."
-            else:
-                return "No complaint registered for this apartment."
-        except cx_Oracle.DatabaseError as e:
-            connection.rollback()
-            error_callback(f"Error submitting maintenance request: {e}")
-            return None
-        except cx_Oracle.InterfaceError as e:
-            connection.rollback()
-            error_callback(f"Database interface error: {e}")
-            return None
-        finally:
-            cursor.close()
-
-    def check_complaint(self, connection, apartment_id, house_no):
-        cursor = connection.cursor()
-        try:
-            cursor.execute("SELECT COUNT(*) FROM Maintenance WHERE apartment_id = :1 AND house_no = :2", (apartment_id, house_no))
-            count = cursor.fetchone()[0]
-            return count > 0
-        except cx_Oracle.DatabaseError as e:
-            print(f"Error checking complaint: {e}")
-            return False
-        finally:
-            cursor.close()
-
-    def incomplete_complaint(self, connection, apartment_id, house_no):
-        cursor = connection.cursor()
-        try:
-            cursor.execute("SELECT COUNT(*) FROM Maintenance WHERE apartment_id = :1 AND house_no = :2 AND status != 'Completed'", (apartment_id, house_no))
-            count = cursor.fetchone()[0]
-            return count > 0
-        except cx_Oracle.DatabaseError as e:
-            print(f"Error checking incomplete complaint: {e}")
-            return False
-        finally:
-            cursor.close()
-
-
-    def display_complaints_gui(self):
-        
-        infos = []
+                connection.commit()
+                return f"Maintenance Service Completed for Apartment ID: {apartment_id}, House No: {house_no}. Issues Fixed: {issues.getvalue()}"
+            except cx_Oracle.DatabaseError as e:
+                connection.rollback()
+                error_callback(f"Error submitting maintenance request: {e}")
+                return None
+            except cx_Oracle.InterfaceError as e:
+                connection.rollback()
+                error_callback(f"Database interface error: {e}")
+                return None
+            finally:
+                cursor.close()
 
-        frames = [
-            self.list_frame, self.update_frame, self.provide_frame,
-            self.add_frame, self.delete_frame, self.tenant_frame, self.latest_frame
-        ]
-        
-        for frame in frames:
-            if frame.winfo_ismapped():
-                frame.pack_forget()
-        self.complaints_frame.pack(fill="both", expand=True)
 
+    def create_complaint_widgets(self):
         columns = ("Apartment Name", "House No", "Issue Description", "Request Date", "Status", "Tenant Name", "Tenant Phone", "Apartment Address")
-        
-        if hasattr(self, 'complaint_tree') and self.complaint_tree.winfo_exists():
-            self.complaint_tree.destroy()
-        
-        if hasattr(self, 'tree_scroll') and self.tree_scroll.winfo_exists():
-            self.tree_scroll.destroy()
-        
+
         self.complaint_tree = ttk.Treeview(self.complaints_frame, columns=columns, show="headings")
         
         for col in columns:
             self.complaint_tree.heading(col, text=col)
             self.complaint_tree.column(col, width=150, anchor="w")  
-       
-        self.complaint_tree.pack(padx=10, pady=10)
 
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute("""SELECT m.issue_description, m.request_date, m.status, t.tenant_name, t.phone_number, 
-                                    a.apartment_name, a.address, m.house_no
-                            FROM Maintenance m
-                            JOIN Tenant t ON m.house_no = t.house_no
-                            JOIN Apartment a ON m.apartment_id = a.apartment_id""")
-            rows = cursor.fetchall()
-
-            if len(rows) == 0:
-                self.complaint_tree.insert("", "end", values=("No complaints registered.",) * len(columns))  
-            else:
-                for row in rows:
-                    self.complaint_tree.insert("", "end", values=(row[5], row[7], row[0], row[1], row[2], row[3], row[4], row[6]))
+        self.complaint_scroll = tk.Scrollbar(self.complaints_frame, orient="vertical", command=self.complaint_tree.yview)
+        self.complaint_scroll.pack(side="right", fill="y")
+        self.complaint_tree.pack(padx=10, pady=10)
 
-        except cx_Oracle.DatabaseError as e:
-            messagebox.showerror("Error", f"Error displaying complaints: {e}")
-        finally:
-            cursor.close()
-    
-    
-    def display_latest_modifications_gui(self): 
-        infos = []
+        self.complaint_pager = TreePager(
+            self, self.complaint_tree, self.complaint_scroll, self.fetch_complaints,
+            lambda e: messagebox.showerror("Error", f"Error displaying complaints: {e}"),
+            empty_values=("No complaints registered.",) * len(columns)
+        )
 
-        frames = [
-            self.list_frame, self.update_frame, self.provide_frame,
-            self.add_frame, self.delete_frame, self.tenant_frame, self.complaints_frame
-        ]
-        
-        for frame in frames:
-            if frame.winfo_ismapped():
-                frame.pack_forget()
-        
-        self.latest_frame.pack(fill="both", expand=True)
+    def display_complaints_gui(self):
+        self._show(self.complaints_frame)
+        self.complaint_pager.reset()
+        self.complaint_pager.load_more()
+
+    # Newest complaints first. Pages join the snapshot started by the first page and expire with it,
+    # and a page read before an invalidation is never written back
+    def fetch_complaints(self, offset, limit):
+        with self._cache_lock:
+            generation = self._complaints_generation
+            cache = self._complaints_cache
+            if cache is not None and time.monotonic() - cache[0] >= self.CACHE_TTL:
+                cache = None
+            if cache is not None and offset in cache[1]:
+                return cache[1][offset]
+        with self._query_lock:
+            self._cur_complaints.execute(None, o=offset, l=limit)
+            rows = self._cur_complaints.fetchall()
+        with self._cache_lock:
+            if generation == self._complaints_generation:
+                if offset == 0:
+                    self._complaints_cache = (time.monotonic(), {0: rows})
+                elif cache is not None and cache is self._complaints_cache:
+                    cache[1][offset] = rows
+        return rows
 
+    
+    def create_latest_widgets(self):
         columns = ("Audit ID", "House No", "Action", "Change Date")
-        
-        if hasattr(self, 'latest_tree') and self.latest_tree.winfo_exists():
-            self.latest_tree.destroy()
-        
-        if hasattr(self, 'tree_scroll') and self.tree_scroll.winfo_exists():
-            self.tree_scroll.destroy()
 
         self.latest_tree = ttk.Treeview(self.latest_frame, columns=columns, show="headings")
         
@@ -987,41 +1349,37 @@ class AdminApp(tk.Tk):
             self.latest_tree.heading(col, text=col)
             self.latest_tree.column(col, width=150, anchor="w")  
 
-        self.tree_scroll = tk.Scrollbar(self.latest_frame, orient="vertical", command=self.latest_tree.yview)
-        self.latest_tree.configure(yscrollcommand=self.tree_scroll.set)
-        self.tree_scroll.pack(side="right", fill="y")
+        self.latest_scroll = tk.Scrollbar(self.latest_frame, orient="vertical", command=self.latest_tree.yview)
+        self.latest_tree.configure(yscrollcommand=self.latest_scroll.set)
+        self.latest_scroll.pack(side="right", fill="y")
 
         self.latest_tree.pack(padx=10, pady=10)
+        self._latest_request = 0
+
+    def display_latest_modifications_gui(self):
+        self._show(self.latest_frame)
+        self.latest_tree.delete(*self.latest_tree.get_children())
+
+        # Only the most recent request fills the tree
+        self._latest_request += 1
+        request = self._latest_request
+        self.run_in_background(
+            self.fetch_latest_modifications,
+            lambda rows: request == self._latest_request and self.show_latest_modifications(rows),
+            lambda e: print("Error executing query:", e)
+        )
 
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute('''SELECT audit_id, house_no, action, change_date 
-                            FROM Audit_Tenant 
-                            WHERE change_date = (SELECT MAX(change_date) FROM Audit_Tenant)''')
-            rows = cursor.fetchall()
-
-            if len(rows) == 0:
-                messagebox.showwarning("Warning", "No modifications made yet")
-            else:
-                for row in rows:
-                    self.latest_tree.insert("", "end", values=row)
-                    infos.append({
-                        "Audit ID": row[0],
-                        "House No": row[1],
-                        "Action": row[2],
-                        "Change Date": row[3],
-                    })
-            return infos  
+    def fetch_latest_modifications(self):
+        with self._query_lock:
+            self._cur_latest.execute(None)
+            return self._cur_latest.fetchall()
 
-        except cx_Oracle.DatabaseError as e:
-            print("Error executing query:", e)
-            return []  
-        except cx_Oracle.InterfaceError as e:
-            print(f"Database interface error: {e}")
-            return []
-        finally:
-            if cursor:
-                cursor.close()
+    def show_latest_modifications(self, rows):
+        if len(rows) == 0:
+            messagebox.showwarning("Warning", "No modifications made yet")
+        else:
+            for row in rows:
+                self.latest_tree.insert("", "end", values=row)
 
 # Main application setup
 if __name__ == "__main__":
@@ -1030,15 +1388,16 @@ if __name__ == "__main__":
     DB_DSN = os.getenv('DB_DSN', 'localhost:1521')
 
     db_connection_instance = DatabaseConnection(DB_USER, DB_PASSWORD, DB_DSN)
-    db_connection = db_connection_instance.get_connection()
 
-    if db_connection:
-        audit_logger = AuditLogger(db_connection)
+    if db_connection_instance:
+        audit_logger = AuditLogger(db_connection_instance)
         tenant_manager = TenantManager()
         tenant_manager.register_observer(audit_logger)
 
-        login_app = LoginPage(tenant_manager, db_connection)
+        login_app = LoginPage(tenant_manager, db_connection_instance)
         login_app.mainloop()
+        audit_logger.close()
+        db_connection_instance.close()
     else:
         print("Failed to create a valid database connection.")
 